@@ -1,7 +1,28 @@
+from unittest import mock
+
 from django.contrib.admin.utils import quote
-from django.test import TestCase
-from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import get_script_prefix, reverse, set_script_prefix
+from django.views.generic import View
 
+from wagtail.admin.utils import get_latest_str
+from wagtail.admin.views.generic.mixins import HookResponseMixin
+from wagtail.admin.views.generic.models import (
+    _pk_url_template_for,
+    _reverse_cached,
+    _reverse_cached_for,
+    _reverse_pk,
+)
+from wagtail.admin.views.generic.permissions import PermissionCheckedMixin
+from wagtail.permission_policies import (
+    AuthenticationOnlyPermissionPolicy,
+    BasePermissionPolicy,
+    BlanketPermissionPolicy,
+)
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -82,6 +103,19 @@ class TestGenericEditView(WagtailTestUtils, TestCase):
                 delete_url_pk = delete_url.split("/")[-2]
                 self.assertEqual(delete_url_pk, quote(object_pk))
 
+    def test_object_string_computed_once(self):
+        with mock.patch(
+            "wagtail.admin.views.generic.models.get_latest_str",
+            wraps=get_latest_str,
+        ) as get_latest_str_mock:
+            response = self.get("string-pk-2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context_data["page_subtitle"],
+            "ModelWithStringTypePrimaryKey object (string-pk-2)",
+        )
+        get_latest_str_mock.assert_called_once()
+
 
 class TestGenericDeleteView(WagtailTestUtils, TestCase):
     fixtures = ["test.json"]
@@ -104,3 +138,210 @@ class TestGenericDeleteView(WagtailTestUtils, TestCase):
         object_pk = "web_407269_1"
         response = self.get(quote(object_pk))
         self.assertEqual(response.status_code, 200)
+
+
+class TestReverseCached(SimpleTestCase):
+    def setUp(self):
+        _reverse_cached_for.cache_clear()
+
+    def test_matches_reverse(self):
+        self.assertEqual(
+            _reverse_cached("wagtailadmin_home"), reverse("wagtailadmin_home")
+        )
+
+    def test_respects_script_prefix(self):
+        original_prefix = get_script_prefix()
+        self.assertEqual(_reverse_cached("wagtailadmin_home"), "/admin/")
+        set_script_prefix("/prefix/")
+        try:
+            self.assertEqual(_reverse_cached("wagtailadmin_home"), "/prefix/admin/")
+        finally:
+            set_script_prefix(original_prefix)
+        self.assertEqual(_reverse_cached("wagtailadmin_home"), "/admin/")
+
+    def test_cache_cleared_on_root_urlconf_change(self):
+        _reverse_cached("wagtailadmin_home")
+        self.assertEqual(_reverse_cached_for.cache_info().currsize, 1)
+        with override_settings(ROOT_URLCONF="wagtail.test.non_root_urls"):
+            self.assertEqual(_reverse_cached_for.cache_info().currsize, 0)
+
+
+class TestReversePk(SimpleTestCase):
+    def setUp(self):
+        _pk_url_template_for.cache_clear()
+
+    def test_matches_reverse(self):
+        for pk in [1, "abc", "a/b_c", "with space", "üñí", "a%b?c#d", "1.5:~@!"]:
+            with self.subTest(pk=pk):
+                self.assertEqual(
+                    _reverse_pk("wagtailsnippets_tests_advert:edit", pk),
+                    reverse("wagtailsnippets_tests_advert:edit", args=(quote(pk),)),
+                )
+
+    def test_uses_cached_template(self):
+        _reverse_pk("wagtailsnippets_tests_advert:edit", 1)
+        with mock.patch("wagtail.admin.views.generic.models.reverse") as mock_reverse:
+            self.assertEqual(
+                _reverse_pk("wagtailsnippets_tests_advert:edit", 2),
+                "/admin/snippets/tests/advert/edit/2/",
+            )
+        mock_reverse.assert_not_called()
+
+    def test_falls_back_to_reverse_for_non_string_converter(self):
+        self.assertEqual(
+            _reverse_pk("wagtailredirects:edit", 12),
+            reverse("wagtailredirects:edit", args=(12,)),
+        )
+        self.assertEqual(_pk_url_template_for.cache_info().currsize, 1)
+
+    def test_cache_cleared_on_root_urlconf_change(self):
+        _reverse_pk("wagtailsnippets_tests_advert:edit", 1)
+        self.assertEqual(_pk_url_template_for.cache_info().currsize, 1)
+        with override_settings(ROOT_URLCONF="wagtail.test.non_root_urls"):
+            self.assertEqual(_pk_url_template_for.cache_info().currsize, 0)
+
+
+class CountingPermissionPolicy(BasePermissionPolicy):
+    def __init__(self, permitted_actions):
+        super().__init__(None)
+        self.permitted_actions = permitted_actions
+        self.calls = []
+
+    def user_has_permission(self, user, action):
+        self.calls.append(action)
+        return action in self.permitted_actions
+
+
+class TestPermissionCheckedMixin(SimpleTestCase):
+    def get_view(self, policy, **attrs):
+        view = type("TestView", (PermissionCheckedMixin, View), attrs)()
+        view.permission_policy = policy
+        view.request = RequestFactory().get("/")
+        view.request.user = AnonymousUser()
+        return view
+
+    def test_user_has_permission_is_cached(self):
+        policy = CountingPermissionPolicy({"add"})
+        view = self.get_view(policy)
+
+        self.assertIs(view.user_has_permission("add"), True)
+        self.assertIs(view.user_has_permission("add"), True)
+        self.assertIs(view.user_has_permission("delete"), False)
+        self.assertIs(view.user_has_permission("delete"), False)
+
+        self.assertEqual(policy.calls, ["add", "delete"])
+
+    def test_user_has_permission_without_policy(self):
+        view = self.get_view(None)
+        self.assertIs(view.user_has_permission("add"), True)
+        self.assertIs(view.user_has_any_permission(["add", "change"]), True)
+
+    def test_dispatch_result_is_reused(self):
+        policy = CountingPermissionPolicy({"change"})
+        view = self.get_view(policy, permission_required="change")
+        view.dispatch(view.request)
+        self.assertIs(view.user_has_permission("change"), True)
+        self.assertEqual(policy.calls, ["change"])
+
+    def test_user_has_any_permission(self):
+        policy = CountingPermissionPolicy({"change"})
+        view = self.get_view(policy)
+        self.assertIs(view.user_has_any_permission(["add", "change"]), True)
+        self.assertIs(view.user_has_any_permission(["add", "delete"]), False)
+        # One-shot iterables are only iterated once
+        self.assertIs(view.user_has_any_permission(a for a in ["add", "change"]), True)
+
+    def test_user_has_any_permission_with_no_actions(self):
+        # Matches the permission policy's result for an empty list of actions
+        view = self.get_view(BlanketPermissionPolicy(None))
+        self.assertIs(view.user_has_any_permission([]), True)
+
+    def test_dispatch_denies_missing_permission(self):
+        policy = CountingPermissionPolicy({"add"})
+        view = self.get_view(policy, permission_required="change")
+        with self.assertRaises(PermissionDenied):
+            view.dispatch(view.request)
+
+    def test_dispatch_denies_missing_any_permission(self):
+        policy = CountingPermissionPolicy({"view"})
+        view = self.get_view(policy, any_permission_required=["add", "change"])
+        with self.assertRaises(PermissionDenied):
+            view.dispatch(view.request)
+
+    def test_dispatch_uses_overridden_user_has_permission(self):
+        policy = CountingPermissionPolicy({"delete"})
+        view = self.get_view(
+            policy,
+            permission_required="delete",
+            user_has_permission=lambda self, permission: True,
+        )
+        view.dispatch(view.request)
+        self.assertEqual(policy.calls, [])
+
+
+class TestPermissionCheckedMixinWithCustomPolicy(SimpleTestCase):
+    class NoDeletePermissionPolicy(AuthenticationOnlyPermissionPolicy):
+        def user_has_permission(self, user, action):
+            if action == "delete":
+                return False
+            return super().user_has_permission(user, action)
+
+    def setUp(self):
+        self.policy = self.NoDeletePermissionPolicy(None)
+        self.user = get_user_model()(is_active=True)
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+
+    def get_view(self, **attrs):
+        view = type("TestView", (PermissionCheckedMixin, View), attrs)()
+        view.permission_policy = self.policy
+        view.request = self.request
+        return view
+
+    def test_user_has_permission_uses_policy_override(self):
+        self.assertIs(self.policy.user_has_permission(self.user, "delete"), False)
+        view = self.get_view()
+        self.assertIs(view.user_has_permission("delete"), False)
+        self.assertIs(view.user_has_permission("change"), True)
+
+    def test_user_has_any_permission_uses_policy_override(self):
+        class NoAnyPermissionPolicy(AuthenticationOnlyPermissionPolicy):
+            def user_has_any_permission(self, user, actions):
+                return False
+
+        view = self.get_view()
+        view.permission_policy = NoAnyPermissionPolicy(None)
+        self.assertIs(view.user_has_any_permission(["change"]), False)
+
+    def test_dispatch_uses_policy_override(self):
+        view = self.get_view(permission_required="delete")
+        with self.assertRaises(PermissionDenied):
+            view.dispatch(self.request)
+
+
+class TestHookResponseMixin(WagtailTestUtils, SimpleTestCase):
+    def test_run_hook_returns_first_response(self):
+        response = HttpResponse()
+
+        def returns_none():
+            return None
+
+        def returns_response():
+            return response
+
+        with self.register_hook("test_hook_name", returns_none, order=-1):
+            with self.register_hook("test_hook_name", returns_response):
+                self.assertIs(HookResponseMixin().run_hook("test_hook_name"), response)
+
+    def test_run_hook_accepts_object_with_status_code(self):
+        # Hooks are documented as being able to return any object with a
+        # status_code property, not just Django response instances
+        class DuckTypedResponse:
+            status_code = 200
+
+        response = DuckTypedResponse()
+        with self.register_hook("test_hook_name", lambda: response):
+            self.assertIs(HookResponseMixin().run_hook("test_hook_name"), response)
+
+    def test_run_hook_without_response(self):
+        self.assertIsNone(HookResponseMixin().run_hook("test_hook_name"))
@@ -1871,3 +1871,29 @@ class TestHeaderButtons(WagtailTestUtils, TestCase):
             [(a.text.strip(), a.get("href")) for a in header_buttons],
             expected_buttons,
         )
+
+    def test_header_buttons_in_edit_view_without_delete_permission(self):
+        self.user.is_superuser = False
+        self.user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="wagtailadmin", codename="access_admin"
+            ),
+            Permission.objects.get(
+                content_type__app_label=self.object._meta.app_label,
+                codename=get_permission_codename("change", self.object._meta),
+            ),
+        )
+        self.user.save()
+
+        response = self.client.get(self.edit_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.context["can_delete"], False)
+        self.assertNotIn("delete_url", response.context)
+        soup = self.get_soup(response.content)
+        header_buttons = soup.select(".w-slim-header .w-dropdown a")
+        # Copy requires the "add" permission, which the user doesn't have
+        expected_buttons = [("Inspect", self.inspect_url)]
+        self.assertEqual(
+            [(a.text.strip(), a.get("href")) for a in header_buttons],
+            expected_buttons,
+        )
@@ -348,10 +348,7 @@ class CreateEditViewOptionalFeaturesMixin:
         if self.request.method != "POST":
             return actions
 
-        if self.draftstate_enabled and (
-            not self.permission_policy
-            or self.permission_policy.user_has_permission(self.request.user, "publish")
-        ):
+        if self.draftstate_enabled and self.user_has_permission("publish"):
             actions.append("publish")
 
         if self.workflow_enabled:
@@ -475,7 +472,7 @@ class CreateEditViewOptionalFeaturesMixin:
         # or cancelling a workflow, remain on the edit view
         remain_actions = {"create", "edit", "cancel-workflow"}
         if self.draftstate_enabled and self.action in remain_actions:
-            return self.get_edit_url()
+            return self.edit_url
         return super().get_success_url()
 
     def save_instance(self):
@@ -1,4 +1,6 @@
 import warnings
+from functools import lru_cache
+from urllib.parse import quote as urlquote
 
 from django.contrib.admin.utils import label_for_field, quote, unquote
 from django.contrib.contenttypes.models import ContentType
@@ -7,16 +9,19 @@ from django.core.exceptions import (
     ImproperlyConfigured,
     PermissionDenied,
 )
+from django.core.signals import setting_changed
 from django.db import models, transaction
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import Cast
+from django.dispatch import receiver
 from django.http import Http404, HttpResponseRedirect
-from django.shortcuts import get_object_or_404, redirect
-from django.urls import reverse
+from django.shortcuts import get_object_or_404
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
 from django.utils.functional import cached_property
+from django.utils.http import RFC3986_SUBDELIMS
 from django.utils.text import capfirst
+from django.utils.translation import get_language, gettext_lazy
 from django.utils.translation import gettext as _
-from django.utils.translation import gettext_lazy
 from django.views.generic import TemplateView
 from django.views.generic.edit import (
     BaseCreateView,
@@ -58,6 +63,77 @@ from .mixins import BeforeAfterHookMixin, HookResponseMixin, LocaleMixin, PanelM
 from .permissions import PermissionCheckedMixin
 
 
+@lru_cache(maxsize=1000)
+def _reverse_cached_for(viewname, urlconf, script_prefix, language):
+    return reverse(viewname, urlconf=urlconf)
+
+
+def _reverse_cached(viewname):
+    """
+    Reverse a URL name that takes no arguments, caching the result.
+
+    The result of reversing such a URL only depends on the active URLconf,
+    script prefix and language (for i18n_patterns), so these make up the cache
+    key along with the URL name.
+    """
+    return _reverse_cached_for(
+        viewname, get_urlconf(), get_script_prefix(), get_language()
+    )
+
+
+# Stands in for the object's primary key when working out the URL template for
+# a URL name that takes a primary key. It is passed to reverse() as-is, without
+# admin quoting (which would escape the underscore), and consists only of
+# characters that reverse() does not URL encode, so it appears unchanged in the
+# reversed URL.
+_PK_PLACEHOLDER = "~wagtail-pk_placeholder~"
+
+
+@lru_cache(maxsize=1000)
+def _pk_url_template_for(viewname, urlconf, script_prefix, language):
+    try:
+        url = reverse(viewname, urlconf=urlconf, args=(_PK_PLACEHOLDER,))
+    except NoReverseMatch:
+        # The URL pattern does not accept arbitrary strings (e.g. it uses the
+        # int converter), so every URL has to be reversed in full
+        return None
+    if url.count(_PK_PLACEHOLDER) != 1:
+        return None
+    return tuple(url.split(_PK_PLACEHOLDER))
+
+
+def _reverse_pk(viewname, pk):
+    """
+    Equivalent to ``reverse(viewname, args=(quote(pk),))``, for URL names that
+    take an object's primary key as their only argument.
+
+    The URL is reversed once with a placeholder primary key, and the parts
+    before and after it are cached (keyed in the same way as ``_reverse_cached``)
+    so that further URLs can be built by string concatenation. Falls back to
+    ``reverse`` if the URL pattern does not accept the placeholder.
+    """
+    quoted_pk = str(quote(pk))
+    template = _pk_url_template_for(
+        viewname, get_urlconf(), get_script_prefix(), get_language()
+    )
+    if template is None or not quoted_pk:
+        return reverse(viewname, args=(quoted_pk,))
+    prefix, suffix = template
+    # Encode the primary key in the same way as reverse(): this copies the
+    # quoting done in django.urls.resolvers.URLResolver._reverse_with_prefix
+    return prefix + urlquote(quoted_pk, safe=RFC3986_SUBDELIMS + "/~:@") + suffix
+
+
+@receiver(setting_changed)
+def clear_reverse_cache(**kwargs):
+    """
+    Clear the cached URLs when the ROOT_URLCONF setting is changed
+    """
+    if kwargs["setting"] == "ROOT_URLCONF":
+        _reverse_cached_for.cache_clear()
+        _pk_url_template_for.cache_clear()
+
+
 class IndexView(
     SpreadsheetExportMixin,
     LocaleMixin,
@@ -272,25 +348,25 @@ class IndexView(
 
     def get_edit_url(self, instance):
         if self.edit_url_name and self.user_has_permission("change"):
-            return reverse(self.edit_url_name, args=(quote(instance.pk),))
+            return _reverse_pk(self.edit_url_name, instance.pk)
 
     def get_copy_url(self, instance):
         if self.copy_url_name and self.user_has_permission("add"):
-            return reverse(self.copy_url_name, args=(quote(instance.pk),))
+            return _reverse_pk(self.copy_url_name, instance.pk)
 
     def get_inspect_url(self, instance):
         if self.inspect_url_name and self.user_has_any_permission(
             {"add", "change", "delete", "view"}
         ):
-            return reverse(self.inspect_url_name, args=(quote(instance.pk),))
+            return _reverse_pk(self.inspect_url_name, instance.pk)
 
     def get_delete_url(self, instance):
         if self.delete_url_name and self.user_has_permission("delete"):
-            return reverse(self.delete_url_name, args=(quote(instance.pk),))
+            return _reverse_pk(self.delete_url_name, instance.pk)
 
     def get_add_url(self):
         if self.add_url_name and self.user_has_permission("add"):
-            return self._set_locale_query_param(reverse(self.add_url_name))
+            return self._set_locale_query_param(_reverse_cached(self.add_url_name))
 
     @cached_property
     def add_url(self):
@@ -422,7 +498,67 @@ class IndexView(
         return super().render_to_response(context, **response_kwargs)
 
 
+class CreateEditViewMixin:
+    """
+    Functionality shared by the generic CreateView and EditView for handling
+    the form submission.
+    """
+
+    edit_item_label = gettext_lazy("Edit")
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.action = self.get_action(request)
+
+    def get_available_actions(self):
+        return self.actions
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        form_class = self.get_form_class()
+        # Add for_user support for PermissionedForm
+        if issubclass(form_class, WagtailAdminModelForm):
+            kwargs["for_user"] = self.request.user
+        return kwargs
+
+    def get_success_buttons(self):
+        return [messages.button(self.edit_url, self.edit_item_label)]
+
+    def get_error_message(self):
+        error_message = self.error_message
+        if error_message is None:
+            return None
+        return capfirst(
+            error_message % {"model_name": self.model and self.model._meta.verbose_name}
+        )
+
+    @cached_property
+    def has_unsaved_changes(self):
+        return self.form.is_bound
+
+    def form_valid(self, form):
+        self.form = form
+        with transaction.atomic():
+            self.object = self.save_instance()
+
+        response = self.save_action()
+
+        hook_response = self.run_after_hook()
+        if hook_response is not None:
+            return hook_response
+
+        return response
+
+    def form_invalid(self, form):
+        self.form = form
+        error_message = self.get_error_message()
+        if error_message is not None:
+            messages.validation_error(self.request, error_message, form)
+        return super().form_invalid(form)
+
+
 class CreateView(
+    CreateEditViewMixin,
     LocaleMixin,
     PanelMixin,
     PermissionCheckedMixin,
@@ -446,19 +582,12 @@ class CreateView(
     submit_button_active_label = gettext_lazy("Creating…")
     actions = ["create"]
 
-    def setup(self, request, *args, **kwargs):
-        super().setup(request, *args, **kwargs)
-        self.action = self.get_action(request)
-
     def get_action(self, request):
         for action in self.get_available_actions():
             if request.POST.get(f"action-{action}"):
                 return action
         return "create"
 
-    def get_available_actions(self):
-        return self.actions
-
     def get_page_subtitle(self):
         if not self.page_subtitle and self.model:
             return capfirst(self.model._meta.verbose_name)
@@ -471,7 +600,7 @@ class CreateView(
         if self.index_url_name:
             items.append(
                 {
-                    "url": reverse(self.index_url_name),
+                    "url": _reverse_cached(self.index_url_name),
                     "label": capfirst(self.model._meta.verbose_name_plural),
                 }
             )
@@ -490,7 +619,7 @@ class CreateView(
                 "Subclasses of wagtail.admin.views.generic.models.CreateView must provide an "
                 "add_url_name attribute or a get_add_url method"
             )
-        return self._set_locale_query_param(reverse(self.add_url_name))
+        return self._set_locale_query_param(_reverse_cached(self.add_url_name))
 
     @cached_property
     def add_url(self):
@@ -502,7 +631,12 @@ class CreateView(
                 "Subclasses of wagtail.admin.views.generic.models.CreateView must provide an "
                 "edit_url_name attribute or a get_edit_url method"
             )
-        return reverse(self.edit_url_name, args=(quote(self.object.pk),))
+        return _reverse_pk(self.edit_url_name, self.object.pk)
+
+    @cached_property
+    def edit_url(self):
+        # Only available once the object has been saved
+        return self.get_edit_url()
 
     def get_success_url(self):
         if not self.index_url_name:
@@ -510,7 +644,7 @@ class CreateView(
                 "Subclasses of wagtail.admin.views.generic.models.CreateView must provide an "
                 "index_url_name attribute or a get_success_url method"
             )
-        return self._set_locale_query_param(reverse(self.index_url_name))
+        return self._set_locale_query_param(_reverse_cached(self.index_url_name))
 
     def get_success_message(self, instance):
         if self.success_message is None:
@@ -523,21 +657,6 @@ class CreateView(
             }
         )
 
-    def get_success_buttons(self):
-        return [messages.button(self.get_edit_url(), _("Edit"))]
-
-    def get_error_message(self):
-        if self.error_message is None:
-            return None
-        return capfirst(
-            self.error_message
-            % {"model_name": self.model and self.model._meta.verbose_name}
-        )
-
-    @cached_property
-    def has_unsaved_changes(self):
-        return self.form.is_bound
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         self.form = context.get("form")
@@ -582,13 +701,7 @@ class CreateView(
         if instance := self.get_initial_form_instance():
             # super().get_form_kwargs() will use self.object as the instance kwarg
             self.object = instance
-        kwargs = super().get_form_kwargs()
-
-        form_class = self.get_form_class()
-        # Add for_user support for PermissionedForm
-        if issubclass(form_class, WagtailAdminModelForm):
-            kwargs["for_user"] = self.request.user
-        return kwargs
+        return super().get_form_kwargs()
 
     def save_instance(self):
         """
@@ -601,34 +714,13 @@ class CreateView(
 
     def save_action(self):
         success_message = self.get_success_message(self.object)
-        success_buttons = self.get_success_buttons()
         if success_message is not None:
             messages.success(
                 self.request,
                 success_message,
-                buttons=success_buttons,
+                buttons=self.get_success_buttons(),
             )
-        return redirect(self.get_success_url())
-
-    def form_valid(self, form):
-        self.form = form
-        with transaction.atomic():
-            self.object = self.save_instance()
-
-        response = self.save_action()
-
-        hook_response = self.run_after_hook()
-        if hook_response is not None:
-            return hook_response
-
-        return response
-
-    def form_invalid(self, form):
-        self.form = form
-        error_message = self.get_error_message()
-        if error_message is not None:
-            messages.validation_error(self.request, error_message, form)
-        return super().form_invalid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
 
 class CopyViewMixin:
@@ -646,6 +738,7 @@ class CopyView(CopyViewMixin, CreateView):
 
 
 class EditView(
+    CreateEditViewMixin,
     LocaleMixin,
     PanelMixin,
     PermissionCheckedMixin,
@@ -673,14 +766,8 @@ class EditView(
     submit_button_active_label = gettext_lazy("Saving…")
     actions = ["edit"]
 
-    def setup(self, request, *args, **kwargs):
-        super().setup(request, *args, **kwargs)
-        self.action = self.get_action(request)
-
     @cached_property
     def object_pk(self):
-        # Must be a cached_property to prevent this from being re-run on the unquoted
-        # pk written back by get_object, which would result in it being unquoted again.
         try:
             quoted_pk = self.kwargs[self.pk_url_kwarg]
         except KeyError:
@@ -693,18 +780,20 @@ class EditView(
                 return action
         return "edit"
 
-    def get_available_actions(self):
-        return self.actions
-
     def get_object(self, queryset=None):
-        # SingleObjectMixin.get_object looks for the unquoted pk in self.kwargs,
-        # so we need to write it back there.
-        self.kwargs[self.pk_url_kwarg] = self.object_pk
-        return super().get_object(queryset)
+        if queryset is None:
+            queryset = self.get_queryset()
+        return get_object_or_404(queryset, pk=self.object_pk)
 
-    def get_page_subtitle(self):
+    @cached_property
+    def _page_subtitle(self):
+        # The subtitle is used for the page title, header and breadcrumbs, so
+        # only compute the object's string representation once
         return get_latest_str(self.object)
 
+    def get_page_subtitle(self):
+        return self._page_subtitle
+
     def get_breadcrumbs_items(self):
         if not self.model:
             return self.breadcrumbs_items
@@ -712,7 +801,7 @@ class EditView(
         if self.index_url_name:
             items.append(
                 {
-                    "url": reverse(self.index_url_name),
+                    "url": _reverse_cached(self.index_url_name),
                     "label": capfirst(self.model._meta.verbose_name_plural),
                 }
             )
@@ -786,27 +875,31 @@ class EditView(
                 "Subclasses of wagtail.admin.views.generic.models.EditView must provide an "
                 "edit_url_name attribute or a get_edit_url method"
             )
-        return reverse(self.edit_url_name, args=(quote(self.object.pk),))
+        return _reverse_pk(self.edit_url_name, self.object.pk)
+
+    @cached_property
+    def edit_url(self):
+        return self.get_edit_url()
 
     def get_copy_url(self):
         if self.copy_url_name and self.user_has_permission("add"):
-            return reverse(self.copy_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.copy_url_name, self.object.pk)
 
     def get_delete_url(self):
         if self.delete_url_name:
-            return reverse(self.delete_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.delete_url_name, self.object.pk)
 
     def get_history_url(self):
         if self.history_url_name:
-            return reverse(self.history_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.history_url_name, self.object.pk)
 
     def get_inspect_url(self):
         if self.inspect_url_name:
-            return reverse(self.inspect_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.inspect_url_name, self.object.pk)
 
     def get_usage_url(self):
         if self.usage_url_name:
-            return reverse(self.usage_url_name, args=[quote(self.object.pk)])
+            return _reverse_pk(self.usage_url_name, self.object.pk)
 
     def get_success_url(self):
         if not self.index_url_name:
@@ -814,7 +907,7 @@ class EditView(
                 "Subclasses of wagtail.admin.views.generic.models.EditView must provide an "
                 "index_url_name attribute or a get_success_url method"
             )
-        return reverse(self.index_url_name)
+        return _reverse_cached(self.index_url_name)
 
     def get_translations(self):
         if not self.edit_url_name:
@@ -822,18 +915,11 @@ class EditView(
         return [
             {
                 "locale": translation.locale,
-                "url": reverse(self.edit_url_name, args=[quote(translation.pk)]),
+                "url": _reverse_pk(self.edit_url_name, translation.pk),
             }
             for translation in self.object.get_translations().select_related("locale")
         ]
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        form_class = self.get_form_class()
-        if issubclass(form_class, WagtailAdminModelForm):
-            kwargs["for_user"] = self.request.user
-        return kwargs
-
     def save_instance(self):
         """
         Called after the form is successfully validated - saves the object to the db.
@@ -853,14 +939,13 @@ class EditView(
 
     def save_action(self):
         success_message = self.get_success_message()
-        success_buttons = self.get_success_buttons()
         if success_message is not None:
             messages.success(
                 self.request,
                 success_message,
-                buttons=success_buttons,
+                buttons=self.get_success_buttons(),
             )
-        return redirect(self.get_success_url())
+        return HttpResponseRedirect(self.get_success_url())
 
     def get_success_message(self):
         if self.success_message is None:
@@ -873,46 +958,11 @@ class EditView(
             }
         )
 
-    def get_success_buttons(self):
-        return [messages.button(self.get_edit_url(), _("Edit"))]
-
-    def get_error_message(self):
-        if self.error_message is None:
-            return None
-        return capfirst(
-            self.error_message
-            % {"model_name": self.model and self.model._meta.verbose_name}
-        )
-
-    def form_valid(self, form):
-        self.form = form
-        with transaction.atomic():
-            self.object = self.save_instance()
-
-        response = self.save_action()
-
-        hook_response = self.run_after_hook()
-        if hook_response is not None:
-            return hook_response
-
-        return response
-
-    def form_invalid(self, form):
-        self.form = form
-        error_message = self.get_error_message()
-        if error_message is not None:
-            messages.validation_error(self.request, error_message, form)
-        return super().form_invalid(form)
-
-    @cached_property
-    def has_unsaved_changes(self):
-        return self.form.is_bound
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         self.form = context.get("form")
         side_panels = self.get_side_panels()
-        context["action_url"] = self.get_edit_url()
+        context["action_url"] = self.edit_url
         context["history_url"] = self.get_history_url()
         context["side_panels"] = side_panels
         context["media"] += side_panels.media
@@ -953,20 +1003,22 @@ class DeleteView(
         self.usage_url = self.get_usage_url()
         self.usage = self.get_usage()
 
-    def get_object(self, queryset=None):
-        # If the object has already been loaded, return it to avoid another query
-        if getattr(self, "object", None):
-            return self.object
-
-        # SingleObjectMixin.get_object looks for the unquoted pk in self.kwargs,
-        # so we need to write it back there.
+    @cached_property
+    def object_pk(self):
         try:
             quoted_pk = self.kwargs[self.pk_url_kwarg]
         except KeyError:
             quoted_pk = self.args[0]
-        self.kwargs[self.pk_url_kwarg] = unquote(str(quoted_pk))
+        return unquote(str(quoted_pk))
 
-        return super().get_object(queryset)
+    def get_object(self, queryset=None):
+        # If the object has already been loaded, return it to avoid another query
+        if getattr(self, "object", None):
+            return self.object
+
+        if queryset is None:
+            queryset = self.get_queryset()
+        return get_object_or_404(queryset, pk=self.object_pk)
 
     def get_usage(self):
         if not self.usage_url:
@@ -982,11 +1034,17 @@ class DeleteView(
                 "Subclasses of wagtail.admin.views.generic.models.DeleteView must provide an "
                 "index_url_name attribute or a get_success_url method"
             )
-        return reverse(self.index_url_name)
+        return _reverse_cached(self.index_url_name)
 
-    def get_page_subtitle(self):
+    @cached_property
+    def _page_subtitle(self):
+        # The subtitle is used for both the page title and the header, so only
+        # compute the object's string representation once
         return str(self.object)
 
+    def get_page_subtitle(self):
+        return self._page_subtitle
+
     def get_breadcrumbs_items(self):
         return []
 
@@ -996,13 +1054,13 @@ class DeleteView(
                 "Subclasses of wagtail.admin.views.generic.models.DeleteView must provide a "
                 "delete_url_name attribute or a get_delete_url method"
             )
-        return reverse(self.delete_url_name, args=(quote(self.object.pk),))
+        return _reverse_pk(self.delete_url_name, self.object.pk)
 
     def get_usage_url(self):
         # Usage URL is optional, allow it to be unset
         if self.usage_url_name:
             return (
-                reverse(self.usage_url_name, args=(quote(self.object.pk),))
+                _reverse_pk(self.usage_url_name, self.object.pk)
                 + "?describe_on_delete=1"
             )
 
@@ -1079,7 +1137,7 @@ class InspectView(PermissionCheckedMixin, WagtailAdminTemplateMixin, TemplateVie
         if self.index_url_name:
             items.append(
                 {
-                    "url": reverse(self.index_url_name),
+                    "url": _reverse_cached(self.index_url_name),
                     "label": capfirst(self.model._meta.verbose_name_plural),
                 }
             )
@@ -1168,11 +1226,11 @@ class InspectView(PermissionCheckedMixin, WagtailAdminTemplateMixin, TemplateVie
 
     def get_edit_url(self):
         if self.edit_url_name and self.user_has_permission("change"):
-            return reverse(self.edit_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.edit_url_name, self.object.pk)
 
     def get_delete_url(self):
         if self.delete_url_name and self.user_has_permission("delete"):
-            return reverse(self.delete_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.delete_url_name, self.object.pk)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1248,11 +1306,11 @@ class RevisionsCompareView(WagtailAdminTemplateMixin, TemplateView):
 
     def get_history_url(self):
         if self.history_url_name:
-            return reverse(self.history_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.history_url_name, self.object.pk)
 
     def get_edit_url(self):
         if self.edit_url_name:
-            return reverse(self.edit_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.edit_url_name, self.object.pk)
 
     def _get_revision_and_heading(self, revision_id):
         if revision_id == "live":
@@ -1364,7 +1422,7 @@ class UnpublishView(HookResponseMixin, WagtailAdminTemplateMixin, TemplateView):
         if self.edit_url_name:
             return [
                 messages.button(
-                    reverse(self.edit_url_name, args=(quote(self.object.pk),)),
+                    _reverse_pk(self.edit_url_name, self.object.pk),
                     _("Edit"),
                 )
             ]
@@ -1383,12 +1441,12 @@ class UnpublishView(HookResponseMixin, WagtailAdminTemplateMixin, TemplateView):
                 "Subclasses of wagtail.admin.views.generic.models.UnpublishView "
                 "must provide an unpublish_url_name attribute or a get_unpublish_url method"
             )
-        return reverse(self.unpublish_url_name, args=(quote(self.object.pk),))
+        return _reverse_pk(self.unpublish_url_name, self.object.pk)
 
     def get_usage_url(self):
         # Usage URL is optional, allow it to be unset
         if self.usage_url_name:
-            return reverse(self.usage_url_name, args=(quote(self.object.pk),))
+            return _reverse_pk(self.usage_url_name, self.object.pk)
 
     def unpublish(self):
         hook_response = self.run_hook("before_unpublish", self.request, self.object)
@@ -1409,11 +1467,12 @@ class UnpublishView(HookResponseMixin, WagtailAdminTemplateMixin, TemplateView):
             return hook_response
 
         success_message = self.get_success_message()
-        success_buttons = self.get_success_buttons()
         if success_message is not None:
-            messages.success(request, success_message, buttons=success_buttons)
+            messages.success(
+                request, success_message, buttons=self.get_success_buttons()
+            )
 
-        return redirect(self.get_next_url())
+        return HttpResponseRedirect(self.get_next_url())
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1476,9 +1535,7 @@ class RevisionsUnscheduleView(WagtailAdminTemplateMixin, TemplateView):
 
     def get_success_buttons(self):
         return [
-            messages.button(
-                reverse(self.edit_url_name, args=(quote(self.object.pk),)), _("Edit")
-            )
+            messages.button(_reverse_pk(self.edit_url_name, self.object.pk), _("Edit"))
         ]
 
     def get_next_url(self):
@@ -1491,7 +1548,7 @@ class RevisionsUnscheduleView(WagtailAdminTemplateMixin, TemplateView):
                 "Subclasses of wagtail.admin.views.generic.models.RevisionsUnscheduleView "
                 " must provide a history_url_name attribute or a get_next_url method"
             )
-        return reverse(self.history_url_name, args=(quote(self.object.pk),))
+        return _reverse_pk(self.history_url_name, self.object.pk)
 
     def get_page_subtitle(self):
         return capfirst(
@@ -1519,12 +1576,11 @@ class RevisionsUnscheduleView(WagtailAdminTemplateMixin, TemplateView):
         self.revision.save(user=request.user, update_fields=["approved_go_live_at"])
 
         success_message = self.get_success_message()
-        success_buttons = self.get_success_buttons()
         if success_message:
             messages.success(
                 request,
                 success_message,
-                buttons=success_buttons,
+                buttons=self.get_success_buttons(),
             )
 
-        return redirect(self.get_next_url())
+        return HttpResponseRedirect(self.get_next_url())
@@ -1,4 +1,5 @@
 from django.core.exceptions import PermissionDenied
+from django.utils.functional import cached_property
 
 
 class PermissionCheckedMixin:
@@ -19,20 +20,37 @@ class PermissionCheckedMixin:
     any_permission_required = None
 
     def dispatch(self, request, *args, **kwargs):
-        if self.permission_required is not None:
-            if not self.user_has_permission(self.permission_required):
+        permission_required = self.permission_required
+        any_permission_required = self.any_permission_required
+        if permission_required is None and any_permission_required is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        if permission_required is not None:
+            if not self.user_has_permission(permission_required):
                 raise PermissionDenied
 
-        if self.any_permission_required is not None:
-            if not self.user_has_any_permission(self.any_permission_required):
+        if any_permission_required is not None:
+            if not self.user_has_any_permission(any_permission_required):
                 raise PermissionDenied
 
         return super().dispatch(request, *args, **kwargs)
 
+    @cached_property
+    def _permission_cache(self):
+        # Results of model-level permission checks made during this request, keyed
+        # by action name. The same checks are repeated in dispatch, the context
+        # data and for each row of a listing, so avoid going back to the
+        # permission policy every time.
+        return {}
+
     def user_has_permission(self, permission):
-        return not self.permission_policy or (
-            self.permission_policy.user_has_permission(self.request.user, permission)
-        )
+        cache = self._permission_cache
+        if permission not in cache:
+            policy = self.permission_policy
+            cache[permission] = not policy or (
+                policy.user_has_permission(self.request.user, permission)
+            )
+        return cache[permission]
 
     def user_has_permission_for_instance(self, permission, instance):
         return not self.permission_policy or (
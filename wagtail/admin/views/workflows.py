@@ -305,13 +305,11 @@ class Edit(EditView):
         context["has_workflow_enabled_models"] = bool(get_workflow_enabled_models())
         context["content_type_form"] = self.get_content_type_form()
         context["can_disable"] = (
-            self.permission_policy is None
-            or self.permission_policy.user_has_permission(self.request.user, "delete")
-        ) and self.object.active
+            self.user_has_permission("delete") and self.object.active
+        )
         context["can_enable"] = (
-            self.permission_policy is None
-            or self.permission_policy.user_has_permission(self.request.user, "add")
-        ) and not self.object.active
+            self.user_has_permission("add") and not self.object.active
+        )
         context["media"] = bound_panel.media + form.media
 
         # Only add the pages_formset if the workflow is active
@@ -739,13 +737,11 @@ class EditTask(EditView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["can_disable"] = (
-            self.permission_policy is None
-            or self.permission_policy.user_has_permission(self.request.user, "delete")
-        ) and self.object.active
+            self.user_has_permission("delete") and self.object.active
+        )
         context["can_enable"] = (
-            self.permission_policy is None
-            or self.permission_policy.user_has_permission(self.request.user, "add")
-        ) and not self.object.active
+            self.user_has_permission("add") and not self.object.active
+        )
 
         # TODO: add warning msg when there are pages/snippets currently on this task in a workflow, add interaction like resetting task state when saved
         return context
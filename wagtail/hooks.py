@@ -5,6 +5,10 @@ from wagtail.utils.apps import get_app_submodules
 
 _hooks = {}
 
+# Hook functions registered under each hook name, sorted by their order. Entries
+# are discarded whenever a hook is registered or unregistered under that name.
+_sorted_hooks = {}
+
 
 def register(hook_name, fn=None, order=0):
     """
@@ -33,6 +37,7 @@ def register(hook_name, fn=None, order=0):
     if hook_name not in _hooks:
         _hooks[hook_name] = []
     _hooks[hook_name].append((fn, order))
+    _sorted_hooks.pop(hook_name, None)
 
 
 class TemporaryHook(ContextDecorator):
@@ -45,10 +50,12 @@ class TemporaryHook(ContextDecorator):
             if hook_name not in _hooks:
                 _hooks[hook_name] = []
             _hooks[hook_name].append((fn, self.order))
+            _sorted_hooks.pop(hook_name, None)
 
     def __exit__(self, exc_type, exc_value, traceback):
         for hook_name, fn in self.hooks:
             _hooks[hook_name].remove((fn, self.order))
+            _sorted_hooks.pop(hook_name, None)
 
 
 def register_temporarily(hook_name_or_hooks, fn=None, *, order=0):
@@ -110,6 +117,9 @@ def search_for_hooks():
 def get_hooks(hook_name):
     """Return the hooks function sorted by their order."""
     search_for_hooks()
-    hooks = _hooks.get(hook_name, [])
-    hooks = sorted(hooks, key=itemgetter(1))
-    return [hook[0] for hook in hooks]
+    try:
+        hooks = _sorted_hooks[hook_name]
+    except KeyError:
+        hooks = sorted(_hooks.get(hook_name, []), key=itemgetter(1))
+        hooks = _sorted_hooks[hook_name] = tuple(hook[0] for hook in hooks)
+    return list(hooks)
@@ -25,6 +25,7 @@ class TestLoginView(WagtailTestUtils, TestCase):
     @classmethod
     def tearDownClass(cls):
         del hooks._hooks["test_hook_name"]
+        hooks._sorted_hooks.pop("test_hook_name", None)
 
     def test_before_hook(self):
         def before_hook():
@@ -42,6 +43,17 @@ class TestLoginView(WagtailTestUtils, TestCase):
             hook_fns = hooks.get_hooks("test_hook_name")
             self.assertEqual(hook_fns, [test_hook, after_hook])
 
+    def test_get_hooks_after_registering(self):
+        def other_hook():
+            pass
+
+        self.assertEqual(hooks.get_hooks("test_hook_name"), [test_hook])
+
+        with hooks.register_temporarily("test_hook_name", other_hook, order=-1):
+            self.assertEqual(hooks.get_hooks("test_hook_name"), [other_hook, test_hook])
+
+        self.assertEqual(hooks.get_hooks("test_hook_name"), [test_hook])
+
 
 class TestServeHooks(WagtailTestUtils, TestCase):
     fixtures = ["test.json"]